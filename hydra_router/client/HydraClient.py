@@ -12,7 +12,13 @@ from typing import Optional
 import zmq
 
 from hydra_router.utils.HydraLog import HydraLog
-from hydra_router.constants.DHydra import DHydraClientMsg, DHydraServerDef, DModule
+from hydra_router.utils.HydraSocket import io_threads_for
+from hydra_router.constants.DHydra import (
+    DHydraClientMsg,
+    DHydraServerDef,
+    DHydraSocketDef,
+    DModule,
+)
 
 
 class HydraClient:
@@ -29,6 +35,7 @@ class HydraClient:
         server_hostname: Optional[str] = None,
         server_port: Optional[int] = None,
         id: Optional[str] = DModule.HYDRA_CLIENT,
+        io_threads: int = DHydraSocketDef.IO_THREADS,
     ) -> None:
         """
         Initialize the HydraClient with server connection parameters.
@@ -37,10 +44,13 @@ class HydraClient:
             server_hostname (str): The server hostname to connect to
             server_port (int): The server port to connect to
             client_id (str): Identifier for logging purposes
+            io_threads (int): Number of ZeroMQ I/O threads, 0 to size the
+                pool from the CPU count
         """
         self._server_hostname = server_hostname or DHydraServerDef.HOSTNAME
         self._server_port = server_port or DHydraServerDef.PORT
         self._id = id
+        self._io_threads = io_threads_for(io_threads)
 
         self.server_address = (
             "tcp://" + self._server_hostname + ":" + str(self._server_port)
@@ -77,8 +87,15 @@ class HydraClient:
             Exception: If socket creation or connection fails
         """
         try:
-            self.context = zmq.Context()
+            self.context = zmq.Context(io_threads=self._io_threads)
             self.socket = self.context.socket(zmq.REQ)
+            self.socket.setsockopt(zmq.LINGER, DHydraSocketDef.LINGER)
+            # Only queue requests once the server connection is complete
+            self.socket.setsockopt(zmq.IMMEDIATE, 1)
+            self.socket.setsockopt(zmq.TCP_KEEPALIVE, DHydraSocketDef.TCP_KEEPALIVE)
+            self.socket.setsockopt(
+                zmq.TCP_KEEPALIVE_IDLE, DHydraSocketDef.TCP_KEEPALIVE_IDLE
+            )
             self.socket.connect(self.server_address)
             self.log.info(
                 DHydraClientMsg.CONNECTED.format(server_address=self.server_address)
@@ -106,13 +123,16 @@ class HydraClient:
             Exception: If message sending or receiving fails
         """
         try:
-            self.log.debug(DHydraClientMsg.SENDING.format(message=message))
+            # Only format the debug strings when DEBUG is enabled
+            if self.log.is_debug():
+                self.log.debug(DHydraClientMsg.SENDING.format(message=message))
             if self.socket is not None:
                 self.socket.send(message)
 
                 # Wait for response
                 response: bytes = self.socket.recv()
-                self.log.debug(DHydraClientMsg.RECEIVED.format(response=response))
+                if self.log.is_debug():
+                    self.log.debug(DHydraClientMsg.RECEIVED.format(response=response))
                 return response
             else:
                 raise RuntimeError("Socket not initialized")
@@ -10,22 +10,22 @@
 # !/usr/bin/env python
 
 import argparse
-import json
 import sys
 import time
 from typing import Any, Dict, Optional
 
 from hydra_router.client.HydraClient import HydraClient
+from hydra_router.utils import HydraJson
 from hydra_router.utils.HydraMsg import HydraMsg
 from hydra_router.constants.DHydra import (
     DHydra,
     DHydraServerDef,
+    DHydraSocketDef,
     DHydraClientMsg,
     DHydraLog,
     DMethod,
     DModule,
 )
-from hydra_router.utils.HydraMsg import HydraMsg
 
 
 class HydraClientPing(HydraClient):
@@ -38,6 +38,7 @@ class HydraClientPing(HydraClient):
         self,
         server_hostname: Optional[str] = None,
         server_port: Optional[int] = None,
+        io_threads: int = DHydraSocketDef.IO_THREADS,
     ) -> None:
         """
         Initialize the HydraClientPing with ping-specific parameters.
@@ -45,6 +46,8 @@ class HydraClientPing(HydraClient):
         Args:
             server_hostname (str): The server hostname to connect to
             server_port (int): The server port to connect to
+            io_threads (int): Number of ZeroMQ I/O threads, 0 to size the
+                pool from the CPU count
             ping_count (int): Number of ping messages to send
             ping_interval (float): Interval between pings in seconds
             message_payload (str): Custom payload for ping messages
@@ -53,6 +56,7 @@ class HydraClientPing(HydraClient):
             server_hostname=server_hostname,
             server_port=server_port,
             id=DModule.HYDRA_PING_CLIENT,
+            io_threads=io_threads,
         )
 
     def create_ping_message(self, sequence: int) -> HydraMsg:
@@ -65,19 +69,17 @@ class HydraClientPing(HydraClient):
         Returns:
             HydraMsg: Structured ping message
         """
-        return (
-            HydraMsg(
-                sender=DModule.HYDRA_PING_CLIENT,
-                target=DModule.HYDRA_PONG_SERVER,
-                method=DMethod.PING,
-            ),
+        return HydraMsg(
+            sender=DModule.HYDRA_PING_CLIENT,
+            target=DModule.HYDRA_PONG_SERVER,
+            method=DMethod.PING,
         )
 
     def parse_pong_message(self, response_bytes: bytes) -> Dict[str, Any]:
         """
         Parse a pong response message.
 
-        Attempts to decode and parse a JSON response from the server.
+        Decodes the UTF-8 JSON reply bytes returned by send_message().
         If parsing fails, returns an error dictionary with the raw response.
 
         Args:
@@ -94,9 +96,8 @@ class HydraClientPing(HydraClient):
         try:
             # For now, assume simple JSON response
             # In a full implementation, this would deserialize HydraMsg
-            response_str = response_bytes.decode("utf-8")
-            return json.loads(response_str)  # type: ignore
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return HydraJson.loads(response_bytes)  # type: ignore
+        except (HydraJson.JSONDecodeError, UnicodeDecodeError) as e:
             self.log.warning(f"Failed to parse pong response: {e}")
             return {
                 "error": "Invalid response format",
@@ -124,25 +125,18 @@ class HydraClientPing(HydraClient):
             # Create structured ping message
             ping_msg = self.create_ping_message(sequence)
 
-            # For now, serialize as JSON
-            # (in full implementation, use HydraMsg serialization)
-            ping_data = {
-                "sender": ping_msg._sender,
-                "target": ping_msg._target,
-                "method": ping_msg._method,
-                "payload": ping_msg._payload,
-                "id": str(ping_msg._id),
-            }
-
-            ping_bytes = json.dumps(ping_data).encode("utf-8")
+            # Serialize as JSON
+            ping_bytes = ping_msg.to_json()
 
-            self.log.info(f"Sending ping #{sequence} to {self.server_address}")
+            self.log.debug("Sending ping #%d to %s", sequence, self.server_address)
             self.sent_pings += 1
 
-            # Send ping and wait for pong
-            start_time = time.time()
+            # Send ping and wait for pong. perf_counter() is monotonic and
+            # high resolution, unlike time.time(), which can jump with
+            # wall-clock adjustments.
+            start_time = time.perf_counter()
             response_bytes = self.send_message(ping_bytes)
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             # Parse pong response
             pong_data = self.parse_pong_message(response_bytes)
@@ -152,7 +146,9 @@ class HydraClientPing(HydraClient):
                 round_trip_time = (
                     end_time - start_time
                 ) * 1000  # Convert to milliseconds
-                self.log.info(f"Received pong #{sequence}: RTT={round_trip_time:.2f}ms")
+                self.log.info(
+                    "Received pong #%d: RTT=%.2fms", sequence, round_trip_time
+                )
                 return pong_data
             else:
                 self.log.error(f"Pong error for ping #{sequence}: {pong_data['error']}")
@@ -181,12 +177,22 @@ class HydraClientPing(HydraClient):
         )
 
         try:
+            # Pings are scheduled against fixed deadlines so the time spent
+            # waiting for each pong doesn't stretch the configured interval.
+            deadline = time.monotonic()
             for i in range(1, self.ping_count + 1):
                 self.send_ping(i)
 
                 # Wait between pings (except for the last one)
                 if i < self.ping_count and self.ping_interval > 0:
-                    time.sleep(self.ping_interval)
+                    deadline += self.ping_interval
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Fell behind (slow pong); restart the schedule from
+                        # now instead of firing a burst of catch-up pings.
+                        deadline = time.monotonic()
 
             # Print summary
             success_rate = (
@@ -250,6 +256,15 @@ Examples:
         help=f"Server port to connect to (default: {DHydraServerDef.PORT})",
     )
 
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=DHydraSocketDef.IO_THREADS,
+        help=DHydraClientMsg.IO_THREADS_HELP.format(
+            io_threads=DHydraSocketDef.IO_THREADS
+        ),
+    )
+
     parser.add_argument(
         "--loglevel",
         "-l",
@@ -271,6 +286,7 @@ Examples:
         client = HydraClientPing(
             server_hostname=args.hostname,
             server_port=args.port,
+            io_threads=args.io_threads,
         )
         client.loglevel(args.loglevel)
 
@@ -51,6 +51,28 @@ class DHydraServerDef:
     PORT: int = 5757
 
 
+# ZeroMQ context/socket defaults
+class DHydraSocketDef:
+    """
+    Default ZeroMQ tuning values shared by HydraClient and HydraServer.
+
+    IO_THREADS sizes the libzmq I/O thread pool of each context. One
+    thread comfortably handles around a gigabit per second of traffic, so
+    only raise it for very busy endpoints. A value of 0 asks for the pool
+    to be sized from the CPU count (capped at IO_THREADS_MAX). The
+    remaining values are applied as socket options before connect/bind.
+    """
+
+    IO_THREADS: int = 1
+    IO_THREADS_MAX: int = 4
+    # Drop unsent messages on close so context.term() never hangs on a
+    # server that has gone away
+    LINGER: int = 0
+    # Detect dead peers on idle connections (idle time in seconds)
+    TCP_KEEPALIVE: int = 1
+    TCP_KEEPALIVE_IDLE: int = 30
+
+
 # HydraClient messages
 class DHydraClientMsg:
     """
@@ -63,6 +85,9 @@ class DHydraClientMsg:
     CLEANUP: str = "HydraClient cleanup complete"
     CONNECTED: str = "HydraClient connected to {server_address}"
     ERROR: str = "HydraClient error: {e}"
+    IO_THREADS_HELP: str = (
+        "ZeroMQ I/O threads, 0 to size from the CPU count (default: {io_threads})"
+    )
     LOGLEVEL_HELP: str = "Log level: DEBUG, INFO, WARNING, ERROR or CRITICAL"
     PORT_HELP: str = "Server port to connect to (default: {server_port})"
     RECEIVED: str = "Received response: {response}"
@@ -114,6 +139,9 @@ class DHydraServerMsg:
     BIND: str = "HydraServer bound to {bind_address}"
     CLEANUP: str = "HydraServer cleanup complete"
     ERROR: str = "HydraServer error: {e}"
+    IO_THREADS_HELP: str = (
+        "ZeroMQ I/O threads, 0 to size from the CPU count (default: {io_threads})"
+    )
     LOGLEVEL_HELP: str = "Log level: DEBUG, INFO, WARNING, ERROR or CRITICAL"
     LOOP_UP: str = "HydraServer message loop on {address}:{port} is up and running"
     PORT_HELP: str = "Port to bind to (default: {port})"
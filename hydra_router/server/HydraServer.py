@@ -12,12 +12,12 @@ from typing import Optional
 import zmq
 
 from hydra_router.utils.HydraLog import HydraLog
+from hydra_router.utils.HydraSocket import io_threads_for
 from hydra_router.constants.DHydra import (
-    DHydraLog,
     DHydraServerDef,
     DHydraServerMsg,
+    DHydraSocketDef,
     DModule,
-    LOG_LEVELS,
 )
 
 
@@ -35,6 +35,7 @@ class HydraServer:
         address: str = "*",
         port: int = DHydraServerDef.PORT,
         id: Optional[str] = DModule.HYDRA_SERVER,
+        io_threads: int = DHydraSocketDef.IO_THREADS,
     ):
         """
         Initialize the HydraServer with binding parameters.
@@ -43,12 +44,16 @@ class HydraServer:
             address (str): The address to bind to (default: "*" for all interfaces)
             port (int): The port to bind to
             server_id (str): Identifier for logging purposes
+            io_threads (int): Number of ZeroMQ I/O threads, 0 to size the
+                pool from the CPU count
         """
 
         self.address = address
         self.port = port
         self._id = id
-        self.log = None
+        self._io_threads = io_threads_for(io_threads)
+        # Set by loglevel(), which must be called before the server starts
+        self.log: HydraLog
 
         self.context: Optional[zmq.Context] = None
         self.socket: Optional[zmq.Socket] = None
@@ -119,8 +124,13 @@ class HydraServer:
         """
         try:
             bind_address = f"tcp://{self.address}:{self.port}"
-            self.context = zmq.Context()
+            self.context = zmq.Context(io_threads=self._io_threads)
             self.socket = self.context.socket(zmq.REP)
+            self.socket.setsockopt(zmq.LINGER, DHydraSocketDef.LINGER)
+            self.socket.setsockopt(zmq.TCP_KEEPALIVE, DHydraSocketDef.TCP_KEEPALIVE)
+            self.socket.setsockopt(
+                zmq.TCP_KEEPALIVE_IDLE, DHydraSocketDef.TCP_KEEPALIVE_IDLE
+            )
             self.socket.bind(bind_address)
         except Exception as e:
             self.log.error(DHydraServerMsg.ERROR.format(e=e))
@@ -153,20 +163,32 @@ class HydraServer:
                 DHydraServerMsg.LOOP_UP.format(address=self.address, port=self.port)
             )
 
+            # The socket can't change while the loop runs, so check it once
+            if self.socket is None:
+                raise RuntimeError("Socket not initialized")
+
+            # Bind the per-message calls once instead of looking them up on
+            # every request
+            recv = self.socket.recv
+            send = self.socket.send
+            handle_message = self.handle_message
+            # Checked per message, so a level change while the loop runs
+            # takes effect; debug strings are only formatted when enabled
+            is_debug = self.log.is_debug
+
             while True:
                 # Wait for next request from client
-                if self.socket is not None:
-                    message = self.socket.recv()
+                message = recv()
+                if is_debug():
                     self.log.debug(DHydraServerMsg.RECEIVE.format(message=message))
 
-                    # Process message using subclass implementation
-                    response = self.handle_message(message)
+                # Process message using subclass implementation
+                response = handle_message(message)
 
-                    # Send reply back to client
-                    self.socket.send(response)
+                # Send reply back to client
+                send(response)
+                if is_debug():
                     self.log.debug(DHydraServerMsg.SENT.format(response=response))
-                else:
-                    raise RuntimeError("Socket not initialized")
 
         except KeyboardInterrupt:
             self.log.info(DHydraServerMsg.SHUTDOWN)
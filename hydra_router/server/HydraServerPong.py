@@ -10,20 +10,21 @@
 # !/usr/bin/env python
 
 import argparse
-import json
-import sys
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict
 
 from hydra_router.constants.DHydra import (
     DHydra,
     DHydraLog,
+    DHydraMsg,
     DHydraServerDef,
     DHydraServerMsg,
+    DHydraSocketDef,
+    DMethod,
     DModule,
-    LOG_LEVELS,
 )
 from hydra_router.server.HydraServer import HydraServer
+from hydra_router.utils import HydraJson
 from hydra_router.utils.HydraMsg import HydraMsg
 
 
@@ -37,6 +38,7 @@ class HydraServerPong(HydraServer):
         self,
         address: str = "*",
         port: int = DHydraServerDef.PORT,
+        io_threads: int = DHydraSocketDef.IO_THREADS,
     ):
         """
         Initialize the HydraServerPong with pong-specific parameters.
@@ -44,21 +46,29 @@ class HydraServerPong(HydraServer):
         Args:
             address (str): The address to bind to (default: "*" for all interfaces)
             port (int): The port to bind to
+            io_threads (int): Number of ZeroMQ I/O threads, 0 to size the
+                pool from the CPU count
         """
         super().__init__(
             address=address,
             port=port,
             id=DModule.HYDRA_PONG_SERVER,
+            io_threads=io_threads,
         )
 
         self.ping_count = 0
         self.pong_count = 0
 
+        # Request handlers keyed by HydraMsg method
+        self._method_handlers: Dict[str, Callable[[Dict[str, Any]], bytes]] = {
+            DMethod.PING: self._handle_ping,
+        }
+
     def parse_ping_message(self, message_bytes: bytes) -> Dict[str, Any]:
         """
         Parse an incoming ping message.
 
-        Attempts to decode and parse a JSON message from the client.
+        Decodes the UTF-8 JSON bytes received from the client socket.
         If parsing fails, returns an error dictionary with the raw message.
 
         Args:
@@ -75,10 +85,8 @@ class HydraServerPong(HydraServer):
         try:
             # For now, assume simple JSON message
             # In a full implementation, this would deserialize HydraMsg
-            message_str = message_bytes.decode("utf-8")
-            self.log.debug(f"Received message: {message_str}")
-            return json.loads(message_str)  # type: ignore
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return HydraJson.loads(message_bytes)  # type: ignore
+        except (HydraJson.JSONDecodeError, UnicodeDecodeError) as e:
             self.log.warning(f"Failed to parse ping message: {e}")
             return {
                 "error": "Invalid message format",
@@ -103,11 +111,16 @@ class HydraServerPong(HydraServer):
         """
         # Extract ping information
         ping_payload = {}
-        if "payload" in ping_data:
+        raw_payload = ping_data.get(DHydraMsg.PAYLOAD)
+        if isinstance(raw_payload, dict):
+            # HydraMsg.to_json() sends the payload as a JSON object, which
+            # has already been decoded along with the rest of the message
+            ping_payload = raw_payload
+        elif raw_payload is not None:
             try:
-                ping_payload = json.loads(ping_data["payload"])
-            except json.JSONDecodeError:
-                ping_payload = {"message": ping_data.get("payload", "")}
+                ping_payload = HydraJson.loads(raw_payload)
+            except HydraJson.JSONDecodeError:
+                ping_payload = {"message": raw_payload}
 
         # Create pong response
         pong_payload = {
@@ -121,9 +134,9 @@ class HydraServerPong(HydraServer):
 
         return HydraMsg(
             sender="HydraPongServer",
-            target=ping_data.get("sender", "Unknown"),
+            target=ping_data.get(DHydraMsg.SENDER, "Unknown"),
             method="pong",
-            payload=json.dumps(pong_payload),
+            payload=pong_payload,
         )
 
     def create_error_response(self, error_message: str) -> bytes:
@@ -144,7 +157,7 @@ class HydraServerPong(HydraServer):
             "server_id": "HydraPongServer",
             "timestamp": time.time(),
         }
-        return json.dumps(error_response).encode("utf-8")
+        return HydraJson.dumps(error_response)
 
     def handle_message(self, message: bytes) -> bytes:
         """
@@ -173,42 +186,43 @@ class HydraServerPong(HydraServer):
                 self.log.error(f"Invalid ping message: {ping_data['error']}")
                 return self.create_error_response(ping_data["error"])
 
-            # Log ping details
-            ping_method = ping_data.get("method", "unknown")
-            ping_sender = ping_data.get("sender", "unknown")
-
-            if ping_method == "ping":
-                self.log.info(f"Received ping #{self.ping_count} from {ping_sender}")
-
-                # Create pong response
-                pong_msg = self.create_pong_response(ping_data)
-
-                # Serialize pong response
-                # (in full implementation, use HydraMsg serialization)
-                pong_data = {
-                    "sender": pong_msg._sender,
-                    "target": pong_msg._target,
-                    "method": pong_msg._method,
-                    "payload": pong_msg._payload,
-                    "id": str(pong_msg._id),
-                }
-
-                pong_bytes = json.dumps(pong_data).encode("utf-8")
-                self.pong_count += 1
-
-                self.log.info(f"Sending pong #{self.pong_count} to {ping_sender}")
-                return pong_bytes
-
-            else:
+            ping_method = ping_data.get(DHydraMsg.METHOD, "unknown")
+            handler = self._method_handlers.get(ping_method)
+            if handler is None:
                 error_msg = f"Unsupported method: {ping_method}"
                 self.log.warning(error_msg)
                 return self.create_error_response(error_msg)
 
+            return handler(ping_data)
+
         except Exception as e:
             error_msg = f"Failed to process ping message: {e}"
             self.log.error(error_msg)
             return self.create_error_response(error_msg)
 
+    def _handle_ping(self, ping_data: Dict[str, Any]) -> bytes:
+        """
+        Build the serialized pong reply for a parsed ping message.
+
+        Args:
+            ping_data (Dict[str, Any]): Parsed ping message data
+
+        Returns:
+            bytes: The pong response to send back to the client
+        """
+        ping_sender = ping_data.get(DHydraMsg.SENDER, "unknown")
+        self.log.info("Received ping #%d from %s", self.ping_count, ping_sender)
+
+        # Create pong response
+        pong_msg = self.create_pong_response(ping_data)
+
+        # Serialize pong response
+        pong_bytes = pong_msg.to_json()
+        self.pong_count += 1
+
+        self.log.debug("Sending pong #%d to %s", self.pong_count, ping_sender)
+        return pong_bytes
+
     def run(self) -> None:
         """
         Run the pong server, listening for ping messages and responding with pongs.
@@ -223,8 +237,6 @@ class HydraServerPong(HydraServer):
         Raises:
             KeyboardInterrupt: When user interrupts with Ctrl+C (caught and handled)
         """
-        self.log.info(f"Starting pong server on {self.address}:{self.port}")
-
         try:
             self.start()
         except KeyboardInterrupt:
@@ -281,6 +293,15 @@ Examples:
         help="Artificial delay before responding to pings in seconds (default: 0.0)",
     )
 
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=DHydraSocketDef.IO_THREADS,
+        help=DHydraServerMsg.IO_THREADS_HELP.format(
+            io_threads=DHydraSocketDef.IO_THREADS
+        ),
+    )
+
     parser.add_argument(
         "--loglevel",
         "-l",
@@ -307,7 +328,9 @@ Examples:
     args = parser.parse_args()
 
     # try:
-    server = HydraServerPong(address=args.address, port=args.port)
+    server = HydraServerPong(
+        address=args.address, port=args.port, io_threads=args.io_threads
+    )
     server.loglevel(args.loglevel)
     server.log.info(
         DHydraServerMsg.STARTING.format(address=args.address, port=args.port)
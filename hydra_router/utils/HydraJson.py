@@ -0,0 +1,86 @@
+# hydra_router/utils/HydraJson.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+# JSON encoding and decoding for HydraRouter wire messages.
+#
+# Uses orjson when it is installed (pip install orjson) and falls back to
+# the standard library json module otherwise. Both produce compact UTF-8
+# encoded bytes, stringify non-str dict keys and raise JSONDecodeError for
+# input that is not bytes-like or str. Differences that remain:
+#   - NaN and Infinity: orjson writes null, json raises ValueError (it
+#     would otherwise write NaN/Infinity, which is not valid JSON)
+#   - Integers outside the 64-bit range: orjson raises TypeError, json
+#     encodes them
+#   - orjson also serializes dataclasses, datetime and UUID, which json
+#     rejects with TypeError
+
+import functools
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+if orjson is not None:
+    # orjson returns bytes and parses bytes directly, so no extra
+    # str <-> bytes conversion is needed on either side. Non-str dict keys
+    # are stringified, as the json module does.
+    dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to compact UTF-8 encoded JSON bytes.
+
+        Args:
+            obj (Any): The object to serialize
+
+        Returns:
+            bytes: The JSON document as UTF-8 bytes
+
+        Raises:
+            ValueError: If obj contains NaN or Infinity
+        """
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode("utf-8")
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Deserialize a JSON document.
+
+        Args:
+            data (bytes | bytearray | memoryview | str): The JSON document
+
+        Returns:
+            Any: The decoded object
+
+        Raises:
+            json.JSONDecodeError: If the data is not valid JSON or is not a
+                bytes-like object or str
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        elif not isinstance(data, (bytes, bytearray, str)):
+            # Match orjson, which reports unsupported input types as a
+            # decode error rather than a TypeError
+            raise json.JSONDecodeError(
+                "Input must be bytes, bytearray, memoryview, or str", "", 0
+            )
+        return json.loads(data)
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so catching this
+# works with either backend.
+JSONDecodeError = json.JSONDecodeError
@@ -8,10 +8,23 @@
 #    License: GPL 3.0
 
 import logging
+import os
 from typing import Any, Dict, Optional
 
 from hydra_router.constants.DHydra import LOG_LEVELS, DHydraLog
 
+# Shared by every HydraLog handler; Formatter instances are stateless
+_FORMATTER = logging.Formatter(
+    fmt="[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Names given to the handlers HydraLog creates, so a later HydraLog for the
+# same logger can tell them apart from handlers added by anyone else
+_FILE_HANDLER = "HydraLog.file"
+_CONSOLE_HANDLER = "HydraLog.console"
+_HANDLER_NAMES = (_FILE_HANDLER, _CONSOLE_HANDLER)
+
 
 class HydraLog:
     """
@@ -46,38 +59,74 @@ class HydraLog:
         self._logger = logging.getLogger(client_id)
 
         # Lowercase the log level
-        log_level = log_level.lower()
+        log_level = (log_level or DHydraLog.DEFAULT).lower()
 
         # The default logger log level
-        self._logger.setLevel(LOG_LEVELS[log_level])
-
-        formatter = logging.Formatter(
-            fmt="[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        level = LOG_LEVELS[log_level]
+        self._logger.setLevel(level)
+
+        # logging.getLogger() returns the same logger for the same client_id,
+        # so a second HydraLog must reuse its handlers instead of stacking
+        # new ones (which would emit and format every record twice). Handlers
+        # that no longer match the requested outputs are removed; handlers
+        # HydraLog didn't create are left alone.
+        log_path = os.path.abspath(log_file) if log_file else None
+        has_file = False
+        has_console = False
+        for handler in list(self._logger.handlers):
+            if handler.name == _FILE_HANDLER:
+                keep = (
+                    isinstance(handler, logging.FileHandler)
+                    and handler.baseFilename == log_path
+                )
+                has_file = has_file or keep
+            elif handler.name == _CONSOLE_HANDLER:
+                keep = to_console
+                has_console = has_console or keep
+            else:
+                continue
+
+            if keep:
+                handler.setLevel(level)
+            else:
+                self._logger.removeHandler(handler)
+                handler.close()
 
         # Optional file handler
-        if log_file:
+        if log_file and not has_file:
             fh = logging.FileHandler(log_file)
-            fh.setLevel(LOG_LEVELS[log_level])
-            fh.setFormatter(formatter)
+            fh.set_name(_FILE_HANDLER)
+            fh.setLevel(level)
+            fh.setFormatter(_FORMATTER)
             self._logger.addHandler(fh)
 
         # Optional console handler
-        if to_console:
+        if to_console and not has_console:
             ch = logging.StreamHandler()
-            ch.setLevel(LOG_LEVELS[log_level])
-            ch.setFormatter(formatter)
+            ch.set_name(_CONSOLE_HANDLER)
+            ch.setLevel(level)
+            ch.setFormatter(_FORMATTER)
             self._logger.addHandler(ch)
 
         self._logger.propagate = False
 
+        # Bind the level methods once so each wrapper call skips the
+        # attribute lookup on the logger. The logger methods check
+        # isEnabledFor() (cached by the logging module) before doing any
+        # formatting, so disabled levels stay cheap.
+        self._log_debug = self._logger.debug
+        self._log_info = self._logger.info
+        self._log_warning = self._logger.warning
+        self._log_error = self._logger.error
+        self._log_critical = self._logger.critical
+
     def loglevel(self, loglevel: str) -> None:
         """
         Set the logging level for this logger instance.
 
         Args:
-            loglevel (str): Log level string from DHydraLog constants
+            loglevel (str): Log level string from DHydraLog constants, in
+                any case
 
         Returns:
             None
@@ -85,7 +134,25 @@ class HydraLog:
         Raises:
             KeyError: If loglevel is not a valid log level constant
         """
-        self._logger.setLevel(LOG_LEVELS[loglevel])
+        level = LOG_LEVELS[loglevel.lower()]
+        self._logger.setLevel(level)
+        # HydraLog's handlers filter by level too, so they must follow the
+        # logger
+        for handler in self._logger.handlers:
+            if handler.name in _HANDLER_NAMES:
+                handler.setLevel(level)
+
+    def is_debug(self) -> bool:
+        """
+        Check whether DEBUG messages will be emitted by this logger.
+
+        Lets callers skip building debug message strings on hot paths
+        when the DEBUG level is disabled.
+
+        Returns:
+            bool: True if DEBUG level logging is enabled
+        """
+        return self._logger.isEnabledFor(logging.DEBUG)
 
     def shutdown(self) -> None:
         """
@@ -98,67 +165,87 @@ class HydraLog:
         logging.shutdown()  # Flush all handler
 
     # Basic log message handling, wraps Python's logging object
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def info(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Log an informational message.
 
         Args:
             message (str): The message to log
+            *args (Any): Values for %-style placeholders in message, only
+                formatted if the record is actually emitted
             extra (Optional[Dict[str, Any]]): Extra context data for logging
 
         Returns:
             None
         """
-        self._logger.info(message, extra=extra)
+        self._log_info(message, *args, extra=extra)
 
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def debug(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Log a debug message.
 
         Args:
             message (str): The message to log
+            *args (Any): Values for %-style placeholders in message, only
+                formatted if the record is actually emitted
             extra (Optional[Dict[str, Any]]): Extra context data for logging
 
         Returns:
             None
         """
-        self._logger.debug(message, extra=extra)
+        self._log_debug(message, *args, extra=extra)
 
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def warning(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Log a warning message.
 
         Args:
             message (str): The message to log
+            *args (Any): Values for %-style placeholders in message, only
+                formatted if the record is actually emitted
             extra (Optional[Dict[str, Any]]): Extra context data for logging
 
         Returns:
             None
         """
-        self._logger.warning(message, extra=extra)
+        self._log_warning(message, *args, extra=extra)
 
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def error(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Log an error message.
 
         Args:
             message (str): The message to log
+            *args (Any): Values for %-style placeholders in message, only
+                formatted if the record is actually emitted
             extra (Optional[Dict[str, Any]]): Extra context data for logging
 
         Returns:
             None
         """
-        self._logger.error(message, extra=extra)
+        self._log_error(message, *args, extra=extra)
 
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def critical(
+        self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Log a critical error message.
 
         Args:
             message (str): The message to log
+            *args (Any): Values for %-style placeholders in message, only
+                formatted if the record is actually emitted
             extra (Optional[Dict[str, Any]]): Extra context data for logging
 
         Returns:
             None
         """
-        self._logger.critical(message, extra=extra)
+        self._log_critical(message, *args, extra=extra)
@@ -7,11 +7,36 @@
 #    Website: https://hydra-router.readthedocs.io/en/latest
 #    License: GPL 3.0
 
-import uuid
-import json
-from typing import Optional, Dict, Any
+import itertools
+import os
+import secrets
+from typing import Optional, Dict, Any, Union
 
 from hydra_router.constants.DHydra import DHydra, DHydraMsg
+from hydra_router.utils import HydraJson
+
+# Message ids are a random per-process prefix plus a counter, which avoids
+# the urandom() call per message that uuid.uuid4() needs. A forked child
+# inherits both, so it gets a fresh prefix and counter straight away.
+_ID_PREFIX: str = ""
+_ID_COUNTER: "itertools.count[int]" = itertools.count()
+
+
+def _reset_ids() -> None:
+    """
+    Pick a new message id prefix and restart the id counter.
+
+    Returns:
+        None
+    """
+    global _ID_PREFIX, _ID_COUNTER
+    _ID_PREFIX = secrets.token_hex(4)
+    _ID_COUNTER = itertools.count()
+
+
+_reset_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ids)
 
 
 class HydraMsg:
@@ -23,6 +48,9 @@ class HydraMsg:
     identification, method specification, and optional payload data.
     """
 
+    # One instance is built per message; slots drop the per-instance __dict__
+    __slots__ = ("_sender", "_target", "_method", "_payload", "_id")
+
     def __init__(
         self,
         sender: Optional[str] = None,
@@ -48,7 +76,7 @@ class HydraMsg:
         self._method = method
 
         self._payload = payload or {}
-        self._id = msg_id or uuid.uuid4()
+        self._id = msg_id or f"{_ID_PREFIX}{next(_ID_COUNTER):012x}"
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HydraMsg":
@@ -61,8 +89,9 @@ class HydraMsg:
         )
 
     @classmethod
-    def from_json(cls, raw: str) -> "HydraMsg":
-        return cls.from_dict(json.loads(raw))
+    def from_json(cls, raw: Union[bytes, str]) -> "HydraMsg":
+        # Accepts the bytes received from a socket as well as str
+        return cls.from_dict(HydraJson.loads(raw))
 
     def sender(self, sender=None):
         if sender is not None:
@@ -76,7 +105,7 @@ class HydraMsg:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            DHydraMsg.ID: self._id,
+            DHydraMsg.ID: str(self._id),
             DHydraMsg.SENDER: self._sender,
             DHydraMsg.TARGET: self._target,
             DHydraMsg.METHOD: self._method,
@@ -84,6 +113,15 @@ class HydraMsg:
             DHydraMsg.V: DHydra.PROTOCOL_VERSION,
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the message to UTF-8 encoded JSON, ready to send on a socket.
+
+        Returns:
+            bytes: The JSON encoded message
+        """
+        return HydraJson.dumps(self.to_dict())
+
     def method(self, method=None):
         if method is not None:
             self._method = method
@@ -0,0 +1,28 @@
+# hydra_router/utils/HydraSocket.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+import os
+
+from hydra_router.constants.DHydra import DHydraSocketDef
+
+
+def io_threads_for(requested: int) -> int:
+    """
+    Resolve the ZeroMQ I/O thread count for a new context.
+
+    Args:
+        requested (int): Requested I/O threads, 0 (or less) to size the
+            pool from the CPU count
+
+    Returns:
+        int: The number of I/O threads to pass to zmq.Context()
+    """
+    if requested > 0:
+        return requested
+    return max(1, min(DHydraSocketDef.IO_THREADS_MAX, (os.cpu_count() or 1) // 2))
@@ -0,0 +1,49 @@
+# tests/test_hydra_client.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+"""Unit tests for HydraClient base class."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from hydra_router.client.HydraClient import HydraClient
+from hydra_router.constants.DHydra import DHydraSocketDef
+
+
+class TestHydraClient:
+    """Test cases for HydraClient base class."""
+
+    @patch("hydra_router.client.HydraClient.HydraClient._setup_socket")
+    def test_io_threads(self, mock_setup):
+        """Test that io_threads is kept as given and 0 is autosized."""
+        assert HydraClient()._io_threads == DHydraSocketDef.IO_THREADS
+        assert HydraClient(io_threads=3)._io_threads == 3
+
+        autosized = HydraClient(io_threads=0)._io_threads
+        assert 1 <= autosized <= DHydraSocketDef.IO_THREADS_MAX
+
+    @patch("hydra_router.client.HydraClient.HydraClient._setup_socket")
+    def test_debug_follows_log_level_changes(self, mock_setup):
+        """Test that send_message honours a level set on the HydraLog directly."""
+        client = HydraClient(id="TestClientDebug")
+        client.loglevel("info")
+        client.socket = MagicMock()
+        client.socket.recv.return_value = b"pong"
+
+        with patch.object(client.log, "debug") as mock_debug:
+            client.send_message(b"ping")
+            mock_debug.assert_not_called()
+
+            client.log.loglevel("debug")
+            assert client.send_message(b"ping") == b"pong"
+            assert mock_debug.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -11,7 +11,7 @@
 
 import json
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from hydra_router.client.HydraClientPing import HydraClientPing
 from hydra_router.constants.DHydra import DHydraServerDef
@@ -132,6 +132,54 @@ class TestHydraClientPing:
 
             assert actual_rate == expected_rate
 
+    @patch("hydra_router.client.HydraClient.HydraClient._setup_socket")
+    def test_io_threads_passed_through(self, mock_setup):
+        """Test that io_threads reaches the HydraClient base class."""
+        assert HydraClientPing(io_threads=3)._io_threads == 3
+
+    def _run_client(self, ping_count: int) -> HydraClientPing:
+        """Build a client whose run() loop can execute without a server."""
+        with patch("hydra_router.client.HydraClient.HydraClient._setup_socket"):
+            client = HydraClientPing()
+        client.ping_count = ping_count
+        client.ping_interval = 1.0
+        client.sent_pings = 0
+        client.received_pongs = 0
+        client.log = MagicMock()
+        client.send_ping = MagicMock()
+        client._cleanup = MagicMock()
+        return client
+
+    @patch("time.sleep")
+    @patch("time.monotonic")
+    def test_run_subtracts_round_trip_from_interval(self, mock_monotonic, mock_sleep):
+        """Test that run() only sleeps for what is left of each interval."""
+        client = self._run_client(ping_count=3)
+        # Schedule starts at 100.0; the pings take 0.25s and 0.4s to answer
+        mock_monotonic.side_effect = [100.0, 100.25, 101.4]
+
+        client.run()
+
+        assert client.send_ping.call_count == 3
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.75, 0.6])
+
+    @patch("time.sleep")
+    @patch("time.monotonic")
+    def test_run_never_sleeps_negative(self, mock_monotonic, mock_sleep):
+        """Test that a pong slower than the interval doesn't cause a negative sleep."""
+        client = self._run_client(ping_count=3)
+        # The first pong arrives 1.5s in, past its 1.0s deadline; the schedule
+        # restarts from then and the second ping takes 0.5s
+        mock_monotonic.side_effect = [100.0, 101.5, 101.5, 102.0]
+
+        client.run()
+
+        assert client.send_ping.call_count == 3
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.5])
+        assert all(delay >= 0 for delay in delays)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
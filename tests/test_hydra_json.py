@@ -0,0 +1,92 @@
+# tests/test_hydra_json.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+"""Unit tests for the HydraJson module, run against both JSON backends."""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from hydra_router.utils import HydraJson
+from hydra_router.utils.HydraMsg import HydraMsg
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Reload HydraJson with the requested backend, restoring it afterwards."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        # A None entry in sys.modules makes "import orjson" raise ImportError
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+    importlib.reload(HydraJson)
+    assert (HydraJson.orjson is None) == (request.param == "json")
+    yield HydraJson
+
+    monkeypatch.undo()
+    importlib.reload(HydraJson)
+
+
+class TestHydraJson:
+    """Test cases for HydraJson, parametrized over orjson and json."""
+
+    def test_dumps_returns_compact_bytes(self, backend):
+        """Test that dumps produces the same compact UTF-8 bytes."""
+        raw = backend.dumps({"sender": "HydraPingClient", "payload": {"n": 1}})
+
+        assert raw == b'{"sender":"HydraPingClient","payload":{"n":1}}'
+
+    def test_dumps_non_ascii(self, backend):
+        """Test that non-ASCII text is encoded as UTF-8, not escaped."""
+        assert backend.dumps({"message": "héllo"}) == '{"message":"héllo"}'.encode(
+            "utf-8"
+        )
+
+    def test_dumps_non_str_keys(self, backend):
+        """Test that non-str dict keys are stringified by both backends."""
+        assert json.loads(backend.dumps({1: "a"})) == {"1": "a"}
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf")])
+    def test_dumps_never_writes_invalid_json(self, backend, value):
+        """Test that NaN/Infinity become null (orjson) or raise (json)."""
+        if backend.orjson is None:
+            with pytest.raises(ValueError):
+                backend.dumps({"x": value})
+        else:
+            assert backend.dumps({"x": value}) == b'{"x":null}'
+
+    @pytest.mark.parametrize("data", [b'{"a":1}', '{"a":1}', bytearray(b'{"a":1}')])
+    def test_loads_accepts_bytes_and_str(self, backend, data):
+        """Test that loads accepts bytes, bytearray and str."""
+        assert backend.loads(data) == {"a": 1}
+
+    def test_loads_accepts_memoryview(self, backend):
+        """Test that loads accepts a memoryview over the raw bytes."""
+        assert backend.loads(memoryview(b'{"a":1}')) == {"a": 1}
+
+    @pytest.mark.parametrize("data", [b"not json", {"a": 1}, 42])
+    def test_loads_errors(self, backend, data):
+        """Test that invalid JSON and unsupported types raise JSONDecodeError."""
+        with pytest.raises(backend.JSONDecodeError):
+            backend.loads(data)
+
+    def test_msg_round_trip(self, backend):
+        """Test that a HydraMsg with non-str payload keys round-trips."""
+        msg = HydraMsg(sender="HydraPingClient", payload={1: "a"})
+
+        restored = HydraMsg.from_json(msg.to_json())
+
+        assert restored.payload() == {"1": "a"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
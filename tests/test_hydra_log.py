@@ -0,0 +1,111 @@
+# tests/test_hydra_log.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+"""Unit tests for HydraLog class."""
+
+import logging
+
+import pytest
+
+from hydra_router.constants.DHydra import DHydraLog
+from hydra_router.utils.HydraLog import HydraLog
+
+
+class TestHydraLog:
+    """Test cases for HydraLog class."""
+
+    def test_reinit_does_not_duplicate_handlers(self):
+        """Test that creating HydraLog twice for one id reuses its handler."""
+        HydraLog(client_id="TestReinit", log_level=DHydraLog.INFO)
+        HydraLog(client_id="TestReinit", log_level=DHydraLog.INFO)
+
+        assert len(logging.getLogger("TestReinit").handlers) == 1
+
+    def test_reinit_updates_handler_level(self):
+        """Test that re-creating HydraLog applies the new log level."""
+        HydraLog(client_id="TestRelevel", log_level=DHydraLog.INFO)
+        HydraLog(client_id="TestRelevel", log_level=DHydraLog.DEBUG)
+
+        logger = logging.getLogger("TestRelevel")
+        assert logger.level == logging.DEBUG
+        assert all(h.level == logging.DEBUG for h in logger.handlers)
+
+    def test_reinit_replaces_log_file(self, tmp_path):
+        """Test that a new log_file replaces the old file handler."""
+        first = tmp_path / "first.log"
+        second = tmp_path / "second.log"
+        HydraLog(client_id="TestFile", log_file=str(first), to_console=False)
+        log = HydraLog(client_id="TestFile", log_file=str(second), to_console=False)
+
+        log.warning("to second")
+
+        handlers = logging.getLogger("TestFile").handlers
+        assert [h.baseFilename for h in handlers] == [str(second)]
+        assert "to second" in second.read_text()
+        assert "to second" not in first.read_text()
+
+    def test_reinit_removes_console_handler(self):
+        """Test that to_console=False drops a console handler from before."""
+        HydraLog(client_id="TestNoConsole", to_console=True)
+        HydraLog(client_id="TestNoConsole", to_console=False)
+
+        assert logging.getLogger("TestNoConsole").handlers == []
+
+    def test_foreign_handlers_left_alone(self):
+        """Test that handlers HydraLog didn't create are neither reused nor changed."""
+        logger = logging.getLogger("TestForeign")
+        foreign = logging.StreamHandler()
+        foreign.setLevel(logging.ERROR)
+        logger.addHandler(foreign)
+
+        log = HydraLog(client_id="TestForeign", log_level=DHydraLog.INFO)
+        log.loglevel(DHydraLog.DEBUG)
+
+        assert foreign in logger.handlers
+        assert foreign.level == logging.ERROR
+        assert len(logger.handlers) == 2
+
+    def test_is_debug(self):
+        """Test that is_debug reflects the configured level."""
+        assert HydraLog(client_id="TestDebugOn", log_level=DHydraLog.DEBUG).is_debug()
+        assert not HydraLog(
+            client_id="TestDebugOff", log_level=DHydraLog.INFO
+        ).is_debug()
+
+    def test_loglevel_updates_handlers(self):
+        """Test that loglevel() changes the handler levels and is_debug."""
+        log = HydraLog(client_id="TestLevelChange", log_level=DHydraLog.INFO)
+        assert not log.is_debug()
+
+        log.loglevel(DHydraLog.DEBUG)
+
+        handlers = logging.getLogger("TestLevelChange").handlers
+        assert log.is_debug()
+        assert all(h.level == logging.DEBUG for h in handlers)
+
+    @pytest.mark.parametrize(
+        "debug, warning",
+        [
+            ("debug", "warning"),
+            ("DEBUG", "WARNING"),
+            ("Debug", "Warning"),
+            ("dEbug", "WaRNING"),
+        ],
+    )
+    def test_log_level_is_case_insensitive(self, debug, warning):
+        """Test that log levels are accepted in any case, including loglevel()."""
+        log = HydraLog(client_id="TestCase", log_level=debug)
+        assert log.is_debug()
+
+        log.loglevel(warning)
+        assert not log.is_debug()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
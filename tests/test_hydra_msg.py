@@ -0,0 +1,102 @@
+# tests/test_hydra_msg.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+"""Unit tests for HydraMsg class."""
+
+import json
+import os
+
+import pytest
+
+from hydra_router.constants.DHydra import DHydra, DHydraMsg
+from hydra_router.utils.HydraMsg import HydraMsg
+
+
+class TestHydraMsg:
+    """Test cases for HydraMsg class."""
+
+    def test_to_json_returns_bytes(self):
+        """Test that to_json produces JSON bytes with all protocol fields."""
+        msg = HydraMsg(
+            sender="HydraPingClient",
+            target="HydraPongServer",
+            method="ping",
+            payload={"sequence": 1},
+        )
+
+        raw = msg.to_json()
+        data = json.loads(raw)
+
+        assert isinstance(raw, bytes)
+        assert data[DHydraMsg.SENDER] == "HydraPingClient"
+        assert data[DHydraMsg.TARGET] == "HydraPongServer"
+        assert data[DHydraMsg.METHOD] == "ping"
+        assert data[DHydraMsg.PAYLOAD] == {"sequence": 1}
+        assert data[DHydraMsg.V] == DHydra.PROTOCOL_VERSION
+        assert data[DHydraMsg.ID] == str(msg._id)
+
+    @pytest.mark.parametrize("as_bytes", [True, False])
+    def test_json_round_trip(self, as_bytes):
+        """Test that from_json restores a message from bytes or str."""
+        msg = HydraMsg(
+            sender="HydraPingClient",
+            target="HydraPongServer",
+            method="ping",
+            payload={"message": "hello"},
+        )
+
+        raw = msg.to_json()
+        restored = HydraMsg.from_json(raw if as_bytes else raw.decode("utf-8"))
+
+        assert restored.to_dict() == msg.to_dict()
+
+    def test_generated_ids_are_unique(self):
+        """Test that messages built without msg_id get distinct str ids."""
+        ids = {HydraMsg()._id for _ in range(1000)}
+
+        assert len(ids) == 1000
+        assert all(isinstance(msg_id, str) for msg_id in ids)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+    def test_generated_ids_are_unique_after_fork(self):
+        """Test that a forked child does not repeat the parent's ids."""
+        HydraMsg()
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, HydraMsg()._id.encode("utf-8"))
+            os._exit(0)
+
+        os.close(write_fd)
+        child_id = os.read(read_fd, 64).decode("utf-8")
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        parent_id = HydraMsg()._id
+        assert child_id
+        assert child_id != parent_id
+        assert child_id[:8] != parent_id[:8]
+
+    def test_keeps_supplied_id(self):
+        """Test that an explicit msg_id is used as-is."""
+        assert HydraMsg(msg_id="abc123")._id == "abc123"
+
+    def test_uses_slots(self):
+        """Test that HydraMsg instances carry no per-instance __dict__."""
+        msg = HydraMsg(sender="HydraPingClient")
+
+        assert not hasattr(msg, "__dict__")
+        with pytest.raises(AttributeError):
+            msg.unknown = "value"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
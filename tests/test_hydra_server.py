@@ -13,7 +13,7 @@ import pytest
 from unittest.mock import patch
 
 from hydra_router.server.HydraServer import HydraServer
-from hydra_router.constants.DHydra import DHydraServerDef
+from hydra_router.constants.DHydra import DHydraServerDef, DHydraSocketDef
 
 
 class ConcreteHydraServer(HydraServer):
@@ -53,6 +53,14 @@ class TestHydraServer:
         assert server.address == address
         assert server.port == port
 
+    def test_io_threads(self):
+        """Test that io_threads is kept as given and 0 is autosized."""
+        assert ConcreteHydraServer()._io_threads == DHydraSocketDef.IO_THREADS
+        assert ConcreteHydraServer(io_threads=3)._io_threads == 3
+
+        autosized = ConcreteHydraServer(io_threads=0)._io_threads
+        assert 1 <= autosized <= DHydraSocketDef.IO_THREADS_MAX
+
     def test_handle_message_implementation(self):
         """Test that handle_message is properly implemented."""
         with patch("hydra_router.server.HydraServer.HydraServer._setup_socket"):
@@ -45,6 +45,11 @@ class TestHydraServerPong:
         assert server.port == port
         assert server.response_delay == delay
 
+    @patch("hydra_router.server.HydraServer.HydraServer._setup_socket")
+    def test_io_threads_passed_through(self, mock_setup):
+        """Test that io_threads reaches the HydraServer base class."""
+        assert HydraServerPong(io_threads=3)._io_threads == 3
+
     @patch("hydra_router.server.HydraServer.HydraServer._setup_socket")
     def test_parse_ping_message_success(self, mock_setup):
         """Test successful parsing of ping message."""
@@ -101,8 +106,9 @@ class TestHydraServerPong:
         assert pong_msg._target == "HydraPingClient"
         assert pong_msg._method == "pong"
 
-        # Parse pong payload
-        pong_payload = json.loads(pong_msg._payload)
+        # The pong payload is sent as a JSON object, not a nested string
+        pong_payload = pong_msg._payload
+        assert isinstance(pong_payload, dict)
         assert pong_payload["original_sequence"] == 42
         assert pong_payload["original_message"] == "test_ping"
         assert pong_payload["original_timestamp"] == 1000.0
@@ -110,6 +116,23 @@ class TestHydraServerPong:
         assert pong_payload["pong_timestamp"] == 2000.0
         assert pong_payload["server_id"] == "HydraPongServer"
 
+    @patch("hydra_router.server.HydraServer.HydraServer._setup_socket")
+    def test_create_pong_response_dict_payload(self, mock_setup):
+        """Test that a payload sent as a JSON object is used as-is."""
+        server = HydraServerPong()
+
+        ping_data = {
+            "sender": "HydraPingClient",
+            "method": "ping",
+            "payload": {"sequence": 7, "message": "dict_ping"},
+        }
+
+        pong_msg = server.create_pong_response(ping_data)
+
+        pong_payload = pong_msg._payload
+        assert pong_payload["original_sequence"] == 7
+        assert pong_payload["original_message"] == "dict_ping"
+
     @patch("hydra_router.server.HydraServer.HydraServer._setup_socket")
     @patch("time.time")
     def test_create_error_response(self, mock_time, mock_setup):
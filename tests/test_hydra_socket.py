@@ -0,0 +1,35 @@
+# tests/test_hydra_socket.py
+#
+#   Hydra Router
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025-2026 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/hydra_router
+#    Website: https://hydra-router.readthedocs.io/en/latest
+#    License: GPL 3.0
+
+"""Unit tests for HydraSocket helpers."""
+
+import pytest
+
+from hydra_router.constants.DHydra import DHydraSocketDef
+from hydra_router.utils.HydraSocket import io_threads_for
+
+
+class TestIoThreadsFor:
+    """Test io_threads_for() resolution."""
+
+    def test_keeps_positive_value(self):
+        """Test that an explicit thread count is used as-is."""
+        assert io_threads_for(3) == 3
+
+    @pytest.mark.parametrize("cpus, expected", [(None, 1), (1, 1), (4, 2), (64, 4)])
+    def test_autosizes_from_cpu_count(self, monkeypatch, cpus, expected):
+        """Test that 0 sizes the pool from the CPU count within the cap."""
+        monkeypatch.setattr("os.cpu_count", lambda: cpus)
+
+        assert io_threads_for(0) == expected
+        assert expected <= DHydraSocketDef.IO_THREADS_MAX
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])